@@ -1,7 +1,33 @@
 # -*- coding=utf-8 -*-
 
-import copy
 import re
+import warnings
+from collections import namedtuple
+from copy import deepcopy
+from itertools import compress
+from keyword import iskeyword
+from operator import itemgetter
+
+# Item, Category, SaveFrame and DataBlock ids are interned (see _intern): the
+# same few names key the child dictionaries of every file that is read
+try:
+    from sys import intern
+except ImportError:
+    # Python 2: intern is a builtin
+    pass
+
+# Item, Category, SaveFrame and DataBlock names, as opposed to objects
+try:
+    # Python 2: names may also be unicode
+    _string_types = basestring
+except NameError:
+    _string_types = str
+
+try:
+    # Python 2: iterate lazily like the Python 3 builtins
+    from itertools import imap as map, izip as zip
+except ImportError:
+    pass
 
 try:
     from collections import OrderedDict
@@ -11,7 +37,7 @@ except ImportError:
         from ordereddict import OrderedDict
     except ImportError:
         # backport not installed: use local OrderedDict
-        from pdbecif.mmcif.ordereddict import OrderedDict
+        from pdbecif.ordereddict import OrderedDict
 
 __author__ = "Glen van Ginkel (Protein Data Bank in Europe; http://pdbe.org)"
 __date__ = "$28-Jun-2018 18:23:30$"
@@ -43,39 +69,84 @@ class CIFWrapperTable(object):
     Categories that are stored as dictionary like objects are represented as
     tables and their items and data are accessed using familiar python 'dot'
     notation.
+
+    In tight loops, fast_col(item_name) returns the values of an item without
+    going through __getattr__; unlike dot access it raises KeyError for
+    missing items. Because of this, an item named fast_col can only be read
+    with table["fast_col"]; assigning table.fast_col sets the item.
     """
 
-    _DATA = {}
-    _preserve_order = False
+    __slots__ = ("_DATA", "_preserve_order", "fast_col")
 
     def __init__(self, d, preserve_token_order=False):
         self._DATA = d
-        if preserve_token_order:
-            self._preserve_order = preserve_token_order
+        self._preserve_order = preserve_token_order
 
     def __getattr__(self, attr_in):
+        if attr_in == "_DATA" or (
+            attr_in.startswith("__") and attr_in.endswith("__")
+        ):
+            # _DATA is not initialised yet (e.g. while unpickling), and
+            # special names (e.g. __getnewargs__, looked up by pickle on
+            # Python 2) are never items
+            raise AttributeError(attr_in)
         return self._DATA.get(attr_in)
 
     def __setattr__(self, itemName, itemValue):
         if itemName == "_DATA":
-            self.__dict__["_DATA"] = copy.deepcopy(itemValue)
+            object.__setattr__(self, "_DATA", itemValue)
+            # keep fast_col bound to the current dictionary
+            object.__setattr__(self, "fast_col", itemValue.__getitem__)
         elif itemName == "_preserve_order":
-            self.__dict__["_preserve_order"] = copy.deepcopy(itemValue)
+            object.__setattr__(self, itemName, itemValue)
         else:
             self.__setitem__(itemName, itemValue)
 
+    def __getstate__(self):
+        # fast_col is bound to _DATA and is rebound by __setstate__, so that
+        # copies and unpickled tables do not read from the original dictionary
+        return {"_DATA": self._DATA, "_preserve_order": self._preserve_order}
+
+    def __setstate__(self, state):
+        self._DATA = state["_DATA"]
+        self._preserve_order = state["_preserve_order"]
+
     def __iter__(self):
         """CIFWrapperTable row iterator which makes row access available"""
-        numRows = len(list(self._DATA.values())[0])
-        idx = 0
-        if self._preserve_order:
-            while idx < numRows:
-                yield OrderedDict((k, v[idx]) for k, v in list(self._DATA.items()))
-                idx += 1
-        else:
-            while idx < numRows:
-                yield dict((k, v[idx]) for k, v in list(self._DATA.items()))
-                idx += 1
+        # Columns are walked in lock-step so each row is built from one value
+        # per column rather than by indexing every column per row
+        keys = tuple(self._DATA)
+        cols = [self._DATA[k] for k in keys]
+        if (
+            cols
+            and len(cols[0]) >= _ROW_FACTORY_MIN_ROWS
+            and not self._preserve_order
+        ):
+            factory = _rowFactory(keys)
+            if factory is not None:
+                return map(factory, *cols)
+        return self._iterRows(keys, cols)
+
+    def _iterRows(self, keys, cols):
+        """Yield the rows of cols as dictionaries keyed by keys"""
+        row_type = OrderedDict if self._preserve_order else dict
+        for row in zip(*cols):
+            yield row_type(zip(keys, row))
+
+    def itertuples(self):
+        """CIFWrapperTable row iterator yielding each row as a named tuple
+        rather than a dictionary; row._asdict() returns the row dictionary.
+
+        Item names that are not valid identifiers are renamed positionally
+        (e.g. `_1`), see collections.namedtuple. Rows of tables with more
+        than 255 items are plain tuples with the same field access and
+        _asdict(), as namedtuple cannot build them on every Python version.
+        """
+        keys = tuple(self._DATA)
+        cols = [self._DATA[k] for k in keys]
+        if not cols:
+            return iter(())
+        return map(_rowType(keys), *cols)
 
     def __contains__(self, itemNameIn):
         """Support for 'in' operator"""
@@ -85,14 +156,12 @@ class CIFWrapperTable(object):
         return self._DATA.get(itemNameIn)
 
     def __setitem__(self, itemName, itemValue):
-        if not isinstance(itemValue, list):
-            itemValue = [
-                itemValue,
-            ]
-        if itemName not in self._DATA:
-            self._DATA.setdefault(itemName, itemValue)
-        else:
-            self._DATA[itemName] = copy.deepcopy(itemValue)
+        """Set (or replace) the values of an item. Lists are stored as a
+        shallow copy, so the values themselves are shared with the caller;
+        any other value is stored as a single-value list."""
+        self._DATA[itemName] = (
+            list(itemValue) if isinstance(itemValue, list) else [itemValue]
+        )
 
     def __delitem__(self, itemName):
         if itemName in self._DATA:
@@ -111,24 +180,11 @@ class CIFWrapperTable(object):
             `{row_id: {"category_name: "value"}}`.
         """
 
-        results = {}
-        try:
-            results.update(
-                [
-                    (idx, dict((k, v[idx]) for k, v in list(self._DATA.items())))
-                    for idx, el in enumerate(self._DATA[item])
-                    if value.match(el)
-                ]
-            )
-        except AttributeError:
-            results.update(
-                [
-                    (idx, dict((k, v[idx]) for k, v in list(self._DATA.items())))
-                    for idx, el in enumerate(self._DATA[item])
-                    if el == value
-                ]
-            )
-        return results
+        hits = list(self._matchIndices(item, value))
+        if not hits:
+            return {}
+        row = self._rowBuilder(len(hits))
+        return dict((idx, row(idx)) for idx in hits)
 
     def searchiter(self, item, value):
         """Highly optimised search for values of items in tables.
@@ -142,13 +198,34 @@ class CIFWrapperTable(object):
             dict: This is effectivelly dictionary with row-like structure
             `{row_id: {"category_name: "value"}}`.
         """
-        for idx, el in enumerate(self._DATA[item]):
-            try:
-                if value.match(el):
-                    yield dict((k, v[idx]) for k, v in list(self._DATA.items()))
-            except AttributeError:
-                if el == value:
-                    yield dict((k, v[idx]) for k, v in list(self._DATA.items()))
+        row = None
+        for idx in self._matchIndices(item, value):
+            if row is None:
+                # only build rows once there is a hit
+                row = self._rowBuilder(len(self._DATA[item]))
+            yield row(idx)
+
+    def _matchIndices(self, item, value):
+        """Return an iterator over the row indices where item matches value.
+
+        The whole column is filtered in one pass (regular expression match or
+        equality) so that rows are only built for the hits.
+        """
+        column = self._DATA[item]
+        match = getattr(value, "match", None)
+        if match is not None:
+            return compress(range(len(column)), map(match, column))
+        return _scanEq(column, value)
+
+    def _rowBuilder(self, n_rows):
+        """Return a function building the row dictionary for a row index,
+        n_rows being the expected number of rows to build"""
+        keys = tuple(self._DATA)
+        cols = [self._DATA[k] for k in keys]
+        factory = _rowFactory(keys) if n_rows >= _ROW_FACTORY_MIN_ROWS else None
+        if factory is None:
+            return lambda idx: dict(zip(keys, [col[idx] for col in cols]))
+        return lambda idx: factory(*[col[idx] for col in cols])
 
     def contents(self):
         return list(self._DATA.keys())
@@ -167,18 +244,33 @@ class CIFWrapper(object):
     CIFWrapper class as well. The CIFWrapper object emulates python objects by
     providing access to mmCIF categories and items using the familiar python
     'dot' notation.
+
+    In tight loops, fast_get(category_name) returns a CIFWrapperTable without
+    going through __getattr__; unlike dot access it raises KeyError for
+    missing categories. Because of this, a category named fast_get can only
+    be accessed with wrapper["fast_get"].
     """
 
     _DATA = {}
     _preserve_order = False
 
-    def __init__(self, d, data_id=None, preserve_token_order=False):
+    def __init__(self, d, data_id=None, preserve_token_order=False, copy=False):
+        """
+        Args:
+            d (dict): mmCIF-like dictionary with or without datablock ID.
+            data_id (str, optional): Datablock ID used if d has none.
+            preserve_token_order (bool, optional): Keep category and item
+                order. Defaults to False.
+            copy (bool, optional): Deep copy d first so the wrapper shares no
+                lists with it. Defaults to False, in which case item lists
+                are wrapped by reference.
+        """
         if preserve_token_order:
             self._DATA = OrderedDict()
             self._preserve_order = True
 
         if d is not None:
-            __dictionary = copy.deepcopy(d)
+            __dictionary = deepcopy(d) if copy else d
             self.data_id = data_id if data_id is not None else ""
             try:
                 # Check if it is a mmCIF-like dictionary with datablock id
@@ -186,11 +278,16 @@ class CIFWrapper(object):
                 #   {
                 #       DATABLOCK_ID: { CATEGORY: { ITEM: VALUE } }
                 #   }
-                (datablock_id, datablock) = list(__dictionary.items())[
-                    0
-                ]  # arbitrarily take the first datablock
-                category = list(datablock.values())[0]
-                item = list(category.values())[0]
+                # arbitrarily take the first datablock; peeking with next()
+                # avoids copying the keys of every level into lists. An empty
+                # dictionary is wrapped as having no categories (None has no
+                # values()), while empty datablocks and categories count as
+                # the datablock and category levels.
+                (datablock_id, datablock) = next(
+                    iter(__dictionary.items()), (None, None)
+                )
+                category = next(iter(datablock.values()), {})
+                item = next(iter(category.values()), None)
                 # Extract data block id from dictionary
                 self.data_id = datablock_id
                 self._DATA = datablock
@@ -204,33 +301,36 @@ class CIFWrapper(object):
                 #       self.data_id == ''
                 self._DATA = __dictionary
             self.__convertDictToCIFWrapperTable()
+        self.fast_get = self._DATA.__getitem__
 
     def __getattr__(self, attr_in):
         return self._DATA.get(attr_in)
 
     def __convertDictToCIFWrapperTable(self):
         """Converter for mmCIF-like dictionaries or MMCIF2Dict parser output"""
-        for k in list(self._DATA.keys()):
-            j = OrderedDict() if self._preserve_order else {}
-            for k2, v2 in list(self._DATA[k].items()):
-                if isinstance(v2, list):
-                    j[k2] = v2
-                else:
-                    j[k2] = [
-                        v2,
-                    ]
-            self._DATA.update(
-                {k: CIFWrapperTable(j, preserve_token_order=self._preserve_order)}
-            )
-
-    def unwrap(self):
-        """Extract encapsulated data to return an mmCIF-like python dictionary"""
-        # TODO: Might have to copy.deepcopy to ensure clean references
-        cleaned_map = OrderedDict() if self._preserve_order else {}
-        for k, v in list(self._DATA.items()):
-            cleaned_map.setdefault(k, OrderedDict() if self._preserve_order else {})
-            for k2, v2 in list(v._DATA.items()):
-                cleaned_map[k][k2] = v2
+        # Tables go into a new mapping so the input dictionary is left as is
+        preserve_order = self._preserve_order
+        tables = OrderedDict() if preserve_order else {}
+        for k, inner in self._DATA.items():
+            j = OrderedDict() if preserve_order else {}
+            for k2, v2 in inner.items():
+                j[k2] = v2 if isinstance(v2, list) else [v2]
+            tables[k] = CIFWrapperTable(j, preserve_token_order=preserve_order)
+        self._DATA = tables
+
+    def unwrap(self, copy=False):
+        """Extract encapsulated data to return an mmCIF-like python dictionary
+
+        Args:
+            copy (bool, optional): Return shallow copies of the category
+                dictionaries instead of the ones held by the wrapper. Item
+                lists are shared either way. Defaults to False.
+        """
+        _dict = OrderedDict if self._preserve_order else dict
+        if copy:
+            cleaned_map = _dict((k, _dict(v._DATA)) for k, v in self._DATA.items())
+        else:
+            cleaned_map = _dict((k, v._DATA) for k, v in self._DATA.items())
         if self.data_id is not None and self.data_id != "":
             return {self.data_id: cleaned_map}
         return {str(id(self)): cleaned_map}
@@ -258,6 +358,22 @@ class CIFWrapper(object):
         return list(self._DATA.keys())
 
 
+def _getSlotsState(obj):
+    """__getstate__ of the __slots__ model classes, which Python 2 cannot
+    pickle without one"""
+    return dict(
+        (name, getattr(obj, name))
+        for name in obj.__slots__
+        if name != "__weakref__" and hasattr(obj, name)
+    )
+
+
+def _setSlotsState(obj, state):
+    """__setstate__ counterpart of _getSlotsState"""
+    for name, value in state.items():
+        setattr(obj, name, value)
+
+
 class Item(object):
 
     """
@@ -266,18 +382,44 @@ class Item(object):
     represent looped categories.
     """
 
+    __slots__ = (
+        "value",
+        "type",
+        "mandatory",
+        "isColumn",
+        "id",
+        "name",
+        "parent",
+        "__weakref__",
+    )
+
+    __getstate__ = _getSlotsState
+    __setstate__ = _setSlotsState
+
     def __init__(self, item_name, parent):
         """"""
         self.value = None
         self.type = str
         self.mandatory = False
         self.isColumn = False
-        self.id = item_name
+        self.id = _intern(item_name)
         self.name = self.id
 
         self.parent = parent
         self.parent.items[self.id] = self
 
+    @classmethod
+    def fromColumn(cls, item_name, parent, item_values, item_type="DEFAULTSTRING"):
+        """Create a looped Item holding item_values (a list of two or more
+        values) in one go; equivalent to Item(item_name, parent) followed
+        by setValue(item_values, item_type)"""
+        item = cls(item_name, parent)
+        item.value = item_values
+        item.type = [item_type] * len(item_values)
+        item.isColumn = True
+        parent.isTable = True
+        return item
+
     def getItemName(self):
         """"""
         return self.id
@@ -294,7 +436,7 @@ class Item(object):
                 self.value = item_value
                 self.isColumn = True
                 self.parent.isTable = True
-                self.type = [item_type for item_type in item_value]
+                self.type = [item_type] * len(item_value)
             else:
                 self.value = item_value
                 self.type = item_type
@@ -315,7 +457,7 @@ class Item(object):
     def getFormattedValue(self):
         """Return the value as it should appear (formatted) in the CIF file"""
         if isinstance(self.value, list):
-            formatted_value = [_formatVal(v) if v else "." for v in self.value]
+            formatted_value = _formatVals(self.value)
         else:
             formatted_value = _formatVal(self.value) if self.value else "."
         return formatted_value
@@ -351,11 +493,25 @@ class Category(object):
     objects.
     """
 
+    __slots__ = (
+        "recycleBin",
+        "isTable",
+        "id",
+        "_maxTagLength",
+        "parent",
+        "preserve_order",
+        "items",
+        "__weakref__",
+    )
+
+    __getstate__ = _getSlotsState
+    __setstate__ = _setSlotsState
+
     def __init__(self, category_id, parent):
         """"""
         self.recycleBin = {}
         self.isTable = False
-        self.id = category_id.lstrip("_")
+        self.id = _intern(category_id.lstrip("_"))
         self._maxTagLength = 0
 
         self.parent = parent
@@ -370,28 +526,23 @@ class Category(object):
 
     def setItem(self, item):
         """"""
-        try:
-            item.isalnum()  # duck typing
-            item = Item(item, self) if item not in self.items else self.items.get(item)
-        except AttributeError:
-            pass
-        try:
-            self._maxTagLength = (
-                len("_" + self.id + item.id)
-                if len("_" + self.id + item.id) > self._maxTagLength
-                else self._maxTagLength
-            )
-        except AttributeError:
-            # TODO: Raise appropriate exception as it is neither string nor
-            # Item
-            return None
-        if (
-            item.value is not None
-            and isinstance(item.value, list)
-            and self.isTable is False
-        ):
+        if isinstance(item, _string_types):
+            # Item() registers itself with this Category
+            existing = self.items.get(item)
+            item = existing if existing is not None else Item(item, self)
+        else:
+            try:
+                item = self.items.setdefault(item.id, item)
+            except AttributeError:
+                # TODO: Raise appropriate exception as it is neither string nor
+                # Item
+                return None
+        tag_len = len(self.id) + len(item.id) + 1  # len("_" + id + item.id)
+        if tag_len > self._maxTagLength:
+            self._maxTagLength = tag_len
+        if not self.isTable and isinstance(item.value, list):
             self.isTable = True
-        return self.items.setdefault(item.id, item)
+        return item
 
     def getItem(self, item_name):
         """"""
@@ -440,9 +591,21 @@ class SaveFrame(object):
     SaveFrame objects are stored and managed by DataBlock objects.
     """
 
+    __slots__ = (
+        "id",
+        "recycleBin",
+        "parent",
+        "preserve_order",
+        "categories",
+        "__weakref__",
+    )
+
+    __getstate__ = _getSlotsState
+    __setstate__ = _setSlotsState
+
     def __init__(self, saveFrame_id, parent):
         """"""
-        self.id = saveFrame_id
+        self.id = _intern(saveFrame_id)
         self.recycleBin = {}
 
         self.parent = parent
@@ -453,7 +616,7 @@ class SaveFrame(object):
 
     def updateId(self, saveFrame_id):
         """Change the SaveFrame definition ID"""
-        self.id = saveFrame_id
+        self.id = _intern(saveFrame_id)
 
     def getId(self):
         """"""
@@ -461,15 +624,10 @@ class SaveFrame(object):
 
     def setCategory(self, category):
         """"""
-        try:
-            category.isalnum()  # duck typing
-            category = (
-                Category(category.lstrip("_"), self)
-                if category.lstrip("_") not in self.categories
-                else self.categories.get(category.lstrip("_"))
-            )
-        except AttributeError:
-            pass
+        if isinstance(category, _string_types):
+            category_id = _intern(category.lstrip("_"))
+            existing = self.categories.get(category_id)
+            return existing if existing is not None else Category(category_id, self)
         return self.categories.setdefault(category.id, category)
 
     def getCategory(self, category):
@@ -512,9 +670,25 @@ class DataBlock(object):
     DataBlock stores and manages SaveFrame and Category objects in CIF files.
     """
 
+    __slots__ = (
+        "id",
+        "recycleBin",
+        "parent",
+        "preserve_order",
+        "categories",
+        "saveFrames",
+        "__weakref__",
+    )
+
+    __getstate__ = _getSlotsState
+    __setstate__ = _setSlotsState
+
+    # Attribute holding each kind of child, used by removeChild
+    _childContainers = {Category: "categories", SaveFrame: "saveFrames"}
+
     def __init__(self, block_id, parent):
         """"""
-        self.id = block_id
+        self.id = _intern(block_id)
         self.recycleBin = {}
 
         self.parent = parent
@@ -530,7 +704,7 @@ class DataBlock(object):
 
     def updateId(self, block_id):
         """Change the DataBlock ID"""
-        self.id = block_id
+        self.id = _intern(block_id)
 
     def getId(self):
         """"""
@@ -540,15 +714,10 @@ class DataBlock(object):
 
     def setCategory(self, category):
         """"""
-        try:
-            category.isalnum()  # duck typing
-            category = (
-                Category(category.lstrip("_"), self)
-                if category.lstrip("_") not in self.categories
-                else self.categories.get(category.lstrip("_"))
-            )
-        except AttributeError:
-            pass
+        if isinstance(category, _string_types):
+            category_id = _intern(category.lstrip("_"))
+            existing = self.categories.get(category_id)
+            return existing if existing is not None else Category(category_id, self)
         return self.categories.setdefault(category.id, category)
 
     def getCategory(self, category):
@@ -567,15 +736,9 @@ class DataBlock(object):
     # SAVEFRAMES
     def setSaveFrame(self, saveFrame):
         """"""
-        try:
-            saveFrame.isalnum()  # duck typing
-            saveFrame = (
-                SaveFrame(saveFrame, self)
-                if saveFrame not in self.saveFrames
-                else self.saveFrames.get(saveFrame)
-            )
-        except AttributeError:
-            pass
+        if isinstance(saveFrame, _string_types):
+            existing = self.saveFrames.get(saveFrame)
+            return existing if existing is not None else SaveFrame(saveFrame, self)
         return self.saveFrames.setdefault(saveFrame.id, saveFrame)
 
     def getSaveFrame(self, saveFrameId):
@@ -598,32 +761,33 @@ class DataBlock(object):
     def removeChild(self, child):
         """Remove Category/SaveFrame from the DataBlock using
         Category/SaveFrame(object) or Category/SaveFrame ID(string)"""
-        if isinstance(child, Category) and child.id in self.categories:
-            self.recycleBin[child.id] = self.categories.pop(child.id)
-            return True
-
-        if isinstance(child, SaveFrame) and child.id in self.saveFrames:
-            self.recycleBin[child.id] = self.saveFrames.pop(child.id)
+        if isinstance(child, str):
+            child_as_cat = child.lstrip("_")
+            removed = self.categories.pop(child_as_cat, None)
+            if removed is not None:
+                self.recycleBin[child_as_cat] = removed
+                container = "categories"
+            else:
+                removed = self.saveFrames.pop(child, None)
+                if removed is None:
+                    return False
+                self.recycleBin[child] = removed
+                container = "saveFrames"
+            warnings.warn("'%s' removed from %s" % (child, container))
             return True
 
-        if isinstance(child, str) and (
-            child.lstrip("_") in self.categories or child in self.saveFrames
-        ):
-            removed = []
-            child_as_cat = child.lstrip("_")
-            if child_as_cat in self.categories:
-                self.recycleBin[child_as_cat] = self.categories.pop(child_as_cat)
-                removed.append("categories")
-            elif child in self.saveFrames:
-                self.recycleBin[child] = self.saveFrames.pop(child)
-                removed.append("saveFrames")
-
-            if removed:
-                print("Warning: '%s' removed from %s" % (child, " and ".join(removed)))
-                return True
+        # walk the MRO so that subclasses of Category/SaveFrame are found
+        for cls in type(child).__mro__:
+            container = self._childContainers.get(cls)
+            if container is not None:
+                break
+        else:
             return False
-
-        return False
+        removed = getattr(self, container).pop(child.id, None)
+        if removed is None:
+            return False
+        self.recycleBin[child.id] = removed
+        return True
 
     def __repr__(self):
         return '<%s "%s">' % (self.__class__.__name__, self.id)
@@ -635,6 +799,17 @@ class CifFile(object):
     dictionary. It stores and manages DataBlock objects.
     """
 
+    __slots__ = (
+        "recycleBin",
+        "file_path",
+        "preserve_order",
+        "data_blocks",
+        "__weakref__",
+    )
+
+    __getstate__ = _getSlotsState
+    __setstate__ = _setSlotsState
+
     def __init__(self, file_path=None, mmcif_data_map=None, preserve_token_order=False):
         """"""
         self.recycleBin = {}
@@ -647,15 +822,9 @@ class CifFile(object):
 
     def setDataBlock(self, datablock):
         """"""
-        try:
-            datablock.isalnum()  # duck typing
-            datablock = (
-                DataBlock(datablock, self)
-                if datablock not in self.data_blocks
-                else self.data_blocks.get(datablock)
-            )
-        except AttributeError as attr_err:
-            pass
+        if isinstance(datablock, _string_types):
+            existing = self.data_blocks.get(datablock)
+            return existing if existing is not None else DataBlock(datablock, self)
         return self.data_blocks.setdefault(datablock.id, datablock)
 
     def getDataBlock(self, dataBlockId):
@@ -679,19 +848,29 @@ class CifFile(object):
         }
         """
         if isinstance(mmcif_data_map, dict) and mmcif_data_map != {}:
-            for datablock_id, categories_items_and_values in list(
-                mmcif_data_map.items()
-            ):
+            for datablock_id, categories_items_and_values in mmcif_data_map.items():
                 data_block_obj = self.setDataBlock(datablock_id)
-                for category, items_and_values in list(
-                    categories_items_and_values.items()
-                ):
+                for category, items_and_values in categories_items_and_values.items():
                     category_obj = data_block_obj.setCategory(category)
-                    for item, value in list(items_and_values.items()):
-                        item = category_obj.setItem(item).setValue(value)
+                    items = category_obj.items
+                    for item, value in items_and_values.items():
+                        # the parser's names are not interned; interning them
+                        # here lets the lookups below match the interned ids
+                        item = _intern(item)
+                        if (
+                            item not in items
+                            and isinstance(value, list)
+                            and len(value) > 1
+                        ):
+                            # looped item: build the whole column at once
+                            category_obj.setItem(
+                                Item.fromColumn(item, category_obj, value)
+                            )
+                        else:
+                            category_obj.setItem(item).setValue(value)
         else:
             if not isinstance(mmcif_data_map, dict):
-                print(
+                warnings.warn(
                     "Data import was unsuccessful. Data was not supplied as mmCIF-like dictionary"
                 )
             elif mmcif_data_map == {}:
@@ -720,32 +899,170 @@ class CifFile(object):
 
 
 # internal functions & classes
+def _intern(name):
+    """Intern name if it is a plain str. sys.intern rejects the other
+    _string_types (str subclasses, and unicode on Python 2), which are
+    returned unchanged."""
+    return intern(name) if type(name) is str else name
+
+
+# Row factories and row types are cached by column names; each cache is
+# cleared when it reaches _ROW_CACHE_SIZE entries
+_row_factories = {}
+_row_types = {}
+_ROW_CACHE_SIZE = 128
+# Compiling a row factory only pays off from this number of rows
+_ROW_FACTORY_MIN_ROWS = 64
+# Python 2 and Python 3 before 3.7 cannot compile more arguments
+_MAX_ARGS = 255
+_identifier = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+
+
+def _cacheRowHelper(cache, keys, helper):
+    """Store helper in cache under keys, clearing the cache when it is full"""
+    if len(cache) >= _ROW_CACHE_SIZE:
+        cache.clear()
+    cache[keys] = helper
+    return helper
+
+
+def _rowFactory(keys):
+    """Return a function that builds a row dictionary, keyed by the column
+    names keys, from one positional value per column, or None when rows have
+    to be built with dict(zip(keys, row)).
+
+    The compiled function body is a single dict display with constant keys,
+    which is much cheaper per row than dict(zip(keys, row)); callers only use
+    it from _ROW_FACTORY_MIN_ROWS rows, below which compiling does not pay
+    off. Only plain str keys are written into the generated source, as the
+    repr of a str subclass need not be a string literal.
+    """
+    factory = _row_factories.get(keys)
+    if factory is not None:
+        return factory
+    if len(keys) > _MAX_ARGS or not all(type(k) is str for k in keys):
+        return None
+    params = ["c%d" % i for i in range(len(keys))]
+    source = "def _row(%s):\n    return {%s}\n" % (
+        ", ".join(params),
+        ", ".join("%r: %s" % (k, p) for k, p in zip(keys, params)),
+    )
+    namespace = {}
+    exec(source, namespace)
+    return _cacheRowHelper(_row_factories, keys, namespace["_row"])
+
+
+def _rowAsDict(row):
+    """Row dictionary of a named tuple row, keyed by the original item names"""
+    return dict(zip(row._keys, row))
+
+
+def _rowType(keys):
+    """Return the named tuple class for rows with column names keys.
+
+    The helpers are underscore names, like the namedtuple ones, so they cannot
+    shadow a field: rename=True renames item names starting with an
+    underscore. _asdict is overridden to key the row dictionary by the item
+    names rather than by the (possibly renamed) field names.
+    """
+    row_type = _row_types.get(keys)
+    if row_type is not None:
+        return row_type
+    namespace = {"__slots__": (), "_keys": keys, "_asdict": _rowAsDict}
+    if len(keys) > _MAX_ARGS:
+        # namedtuple compiles a __new__ taking one argument per field
+        fields = _rowFields(keys)
+        namespace.update(
+            (field, property(itemgetter(i))) for i, field in enumerate(fields)
+        )
+        namespace["_fields"] = fields
+        namespace["__new__"] = lambda cls, *row: tuple.__new__(cls, row)
+        base = tuple
+    else:
+        base = namedtuple("Row", [str(k) for k in keys], rename=True)
+    return _cacheRowHelper(_row_types, keys, type("Row", (base,), namespace))
+
+
+def _rowFields(keys):
+    """Field names for the column names keys, renamed like namedtuple's
+    rename=True does"""
+    fields = []
+    for i, key in enumerate(str(k) for k in keys):
+        if (
+            not _identifier.match(key)
+            or iskeyword(key)
+            or key.startswith("_")
+            or key in fields
+        ):
+            key = "_%d" % i
+        fields.append(key)
+    return tuple(fields)
+
+
+def _scanEq(column, value):
+    """Yield the indices of the elements of column that are equal to value.
+
+    list.index does the comparisons and jumps from hit to hit.
+    """
+    index = column.index
+    idx = -1
+    while True:
+        try:
+            idx = index(value, idx + 1)
+        except ValueError:
+            return
+        yield idx
+
+
+_reserved_start = ("_", "#", "$", "'", '"', "[", "]", ";")
+# Characters that force a value to be quoted or put in a text field
+_special_chars = re.compile(r"[ \n'\"]|" + ascii_char.pattern)
+# Reserved first characters of the values in a NUL separated column
+_reserved_column_start = re.compile(r"\x00[_#$'\"\[\];]")
+
+
 def _formatVal(val):
     """Format any value as it would appear in a CIF file"""
-    reserved = ("_", "#", "$", "'", '"', "[", "]", ";")
-
     val = str(val)
-    has_space = " " in val and "\n" not in val
 
-    if "'" in val:
-        val = '"%s"' % val
-    elif '"' in val:
-        val = "'%s'" % val
-    elif re.search(ascii_char, val):
-        # Checks if non-ascii character present
-        val = '"%s"' % val
-    else:
-        val = ('"%s"' % val) if val.startswith(reserved) or has_space else val
+    # Plain tokens, by far the most common case, are written as they are
+    if not val.startswith(_reserved_start) and not _special_chars.search(val):
+        return val
 
     if "\n" in val:
-        if val[0] in ("'", '"'):
-            val = val[1:-1]
-        val = "\n;" + val + "\n;\n"
-    elif (
-        "\n" not in val
-        and val[0] in ("'", '"')
-        and ("'" in val[1:-1] and '"' in val[1:-1])
+        return "\n;" + val + "\n;\n"
+    if "'" in val:
+        if '"' in val:
+            return "\n;" + val + "\n;\n"
+        return '"%s"' % val
+    if '"' in val:
+        return "'%s'" % val
+    # Leading reserved character, space or non-ASCII character
+    return '"%s"' % val
+
+
+def _formatVals(values):
+    """Format a list of values (a looped item) as they would appear in a CIF
+    file; missing values are written as '.'"""
+    try:
+        # Parser output is made of strings only and can be joined as it is
+        column = "\x00".join(values)
+    except TypeError:
+        column = None
+    if column is None or "" in values:
+        values = [str(v) if v else "." for v in values]
+        column = "\x00".join(values)
+    else:
+        values = list(values)
+    # Scan the whole column at once: when no value needs quoting (the usual
+    # case for looped numeric and identifier columns) nothing else is done
+    column = "\x00" + column
+    if not _special_chars.search(column) and not _reserved_column_start.search(
+        column
     ):
-        val = "\n;" + val[1:-1] + "\n;\n"
-
-    return val
+        return values
+    search = _special_chars.search
+    return [
+        _formatVal(v) if v.startswith(_reserved_start) or search(v) else v
+        for v in values
+    ]
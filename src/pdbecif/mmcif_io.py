@@ -150,9 +150,10 @@ class CifFileWriter(object):
                 #   }
                 datablock_id = ""
                 try:
-                    (datablock_id, datablock) = list(cifObjIn.items())[0]
-                    category = list(datablock.values())[0]
-                    item = list(category.values())[0]
+                    # empty datablocks and categories count as those levels
+                    (datablock_id, datablock) = next(iter(cifObjIn.items()))
+                    category = next(iter(datablock.values()), {})
+                    item = next(iter(category.values()), None)
                     cif_file.import_mmcif_data_map(cifObjIn)
                 except AttributeError:
                     # ... but can also handle
@@ -124,7 +124,7 @@ class MMCIF2Dict:
                     from ordereddict import OrderedDict as _dict
                 except ImportError:
                     # backport not installed: use local OrderedDict
-                    from mmCif.ordereddict import OrderedDict as _dict
+                    from pdbecif.ordereddict import OrderedDict as _dict
         else:
             _dict = dict
 
@@ -222,7 +222,7 @@ class MMCIF2Dict:
                                 isLoop = False
                                 num_item = len(table_names)
                                 if len(table_values_array) % num_item != 0:
-                                    raise mmCifSyntaxError(category)
+                                    raise MMCIFWrapperSyntaxError(category)
                                 for val_index, item in enumerate(table_names):
                                     data_block[category][item] = table_values_array[
                                         val_index::num_item
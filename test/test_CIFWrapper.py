@@ -83,6 +83,24 @@ class CIFWrapperTestCase(unittest.TestCase):
             cif_wrapper.data_id, "NEW_ID", "'NEW_ID' not set correctly as datablock ID"
         )
 
+    def test_init_empty_dictionary(self):
+        cif_wrapper = CIFWrapper({}, "NEW_ID")
+        self.assertEqual(cif_wrapper.contents(), [], "Wrapper should be empty")
+        self.assertEqual(
+            cif_wrapper.data_id, "NEW_ID", "'NEW_ID' not set correctly as datablock ID"
+        )
+        cif_wrapper = CIFWrapper({"EMPTY_BLOCK": {}})
+        self.assertEqual(cif_wrapper.contents(), [], "Wrapper should be empty")
+        self.assertEqual(
+            cif_wrapper.data_id,
+            "EMPTY_BLOCK",
+            "'EMPTY_BLOCK' not set correctly as datablock ID",
+        )
+        cif_wrapper = CIFWrapper({"BLOCK": {"_empty": {}}})
+        self.assertEqual(
+            cif_wrapper.contents(), ["_empty"], "Empty category not wrapped"
+        )
+
     def test_wrapper_contains(self):
         cif_wrapper = CIFWrapper(
             self.raw_dictionary["TEST_BLOCK_2"], "NEW_ID", preserve_token_order=True
@@ -114,6 +132,22 @@ class CIFWrapperTestCase(unittest.TestCase):
             "__getattr__ not returning CIFWrapperTable",
         )
 
+    def test_wrapper_fast_get(self):
+        cif_wrapper = CIFWrapper(
+            self.raw_dictionary["TEST_BLOCK_1"], preserve_token_order=True
+        )
+        table = cif_wrapper.fast_get("_test_category_2")
+        self.assertIs(
+            table, cif_wrapper._test_category_2, "fast_get not returning the table"
+        )
+        self.assertRaises(KeyError, cif_wrapper.fast_get, "_bogus")
+        cif_wrapper = CIFWrapper({"fast_get": {"test_value_1": [1, 2]}})
+        self.assertIsInstance(
+            cif_wrapper["fast_get"],
+            CIFWrapperTable,
+            "Category named fast_get not accessible with dict notation",
+        )
+
     def test_wrapper_delItem(self):
         cif_wrapper = CIFWrapper(
             self.raw_dictionary["TEST_BLOCK_2"], "NEW_ID", preserve_token_order=True
@@ -159,6 +193,55 @@ class CIFWrapperTestCase(unittest.TestCase):
                 "CIFWrapper to dictionary conversion failed",
             )
 
+    def test_unwrap_copy(self):
+        cif_wrapper = CIFWrapper(
+            self.raw_dictionary["TEST_BLOCK_2"], "NEW_ID", preserve_token_order=True
+        )
+        category = cif_wrapper.unwrap()["NEW_ID"]["_test_category_1"]
+        self.assertIs(
+            category,
+            cif_wrapper._test_category_1._DATA,
+            "unwrap() should return the wrapped category dictionaries",
+        )
+        category = cif_wrapper.unwrap(copy=True)["NEW_ID"]["_test_category_1"]
+        self.assertIsNot(
+            category,
+            cif_wrapper._test_category_1._DATA,
+            "unwrap(copy=True) should return copies of the category dictionaries",
+        )
+        self.assertEqual(
+            category,
+            {"test_value_1": [1, 2, 3, 4]},
+            "CIFWrapper to dictionary conversion failed",
+        )
+
+    def test_init_copy(self):
+        raw_category = self.raw_dictionary["TEST_BLOCK_1"]["_test_category_2"]
+        cif_wrapper = CIFWrapper(self.raw_dictionary, preserve_token_order=True)
+        self.assertIsInstance(
+            self.raw_dictionary["TEST_BLOCK_1"]["_test_category_2"],
+            dict,
+            "Input dictionary was modified by CIFWrapper",
+        )
+        self.assertIs(
+            cif_wrapper._test_category_2["test_value_1"],
+            raw_category["test_value_1"],
+            "Item lists should be wrapped by reference by default",
+        )
+        cif_wrapper = CIFWrapper(
+            self.raw_dictionary, preserve_token_order=True, copy=True
+        )
+        self.assertIsNot(
+            cif_wrapper._test_category_2["test_value_1"],
+            raw_category["test_value_1"],
+            "copy=True failed to isolate the wrapper from its input",
+        )
+        self.assertEqual(
+            cif_wrapper._test_category_2["test_value_1"],
+            raw_category["test_value_1"],
+            "copy=True gave inconsistent results",
+        )
+
     def test_listContents(self):
         cif_wrapper = CIFWrapper(
             self.raw_dictionary["TEST_BLOCK_1"], preserve_token_order=True
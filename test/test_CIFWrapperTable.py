@@ -1,6 +1,9 @@
+import copy
+import pickle
+import re
 import unittest
 
-from pdbecif.mmcif import CIFWrapper
+from pdbecif.mmcif import CIFWrapper, CIFWrapperTable
 
 
 class CIFWrapperTableTestCase(unittest.TestCase):
@@ -117,6 +120,14 @@ class CIFWrapperTableTestCase(unittest.TestCase):
             ["a", "b", "c", "d"],
             "Conventional attribute setter failed or gave inconsistent results",
         )
+        new_values = ["e", "f", "g", "h"]
+        cif_wrapper._test_category_1["test_value_2"] = new_values
+        new_values.append("i")
+        self.assertEqual(
+            cif_wrapper._test_category_1["test_value_2"],
+            ["e", "f", "g", "h"],
+            "Attribute setter should store a copy of the list",
+        )
         cif_wrapper._test_category_1["test_value_2"] = "FOO"
         self.assertEqual(
             cif_wrapper._test_category_1["test_value_2"],
@@ -130,6 +141,51 @@ class CIFWrapperTableTestCase(unittest.TestCase):
             "Dot-notation attribute setting failed to overwrite or gave inconsistent results",
         )
 
+    def test_fast_col(self):
+        cif_wrapper = CIFWrapper(
+            self.raw_dictionary["TEST_BLOCK_1"], preserve_token_order=True
+        )
+        table = cif_wrapper._test_category_2
+        self.assertEqual(
+            table.fast_col("test_value_1"),
+            [1, 2, 3, 4],
+            "fast_col not returning the item values",
+        )
+        self.assertRaises(KeyError, table.fast_col, "bogus")
+
+        table["fast_col"] = ["a", "b", "c", "d"]
+        self.assertEqual(
+            table["fast_col"],
+            ["a", "b", "c", "d"],
+            "Item named fast_col not accessible with dict notation",
+        )
+        table.fast_col = ["e", "f", "g", "h"]
+        self.assertEqual(
+            table["fast_col"],
+            ["e", "f", "g", "h"],
+            "Assigning table.fast_col should set the item",
+        )
+        self.assertEqual(
+            table.fast_col("test_value_1"),
+            [1, 2, 3, 4],
+            "Assigning table.fast_col replaced the accessor",
+        )
+
+    def test_fast_col_copy(self):
+        table = CIFWrapperTable({"test_value_1": [1, 2, 3, 4]})
+        for table_copy in (copy.deepcopy(table), pickle.loads(pickle.dumps(table))):
+            table_copy["test_value_1"] = [5, 6]
+            self.assertEqual(
+                table_copy.fast_col("test_value_1"),
+                [5, 6],
+                "fast_col not bound to the copied table",
+            )
+            self.assertEqual(
+                table.fast_col("test_value_1"),
+                [1, 2, 3, 4],
+                "Copying the table modified the original",
+            )
+
     def test_iter(self):
         cif_wrapper = CIFWrapper(
             self.raw_dictionary["TEST_BLOCK_1"], preserve_token_order=True
@@ -161,6 +217,122 @@ class CIFWrapperTableTestCase(unittest.TestCase):
             rows_out, rows_in, "Row iteration failed or gave inconsistent results"
         )
 
+    def test_iter_unordered(self):
+        cif_wrapper = CIFWrapper(
+            {"_test_category": {"id": ["1", "2"], "it's \"quoted\"": ["A", "B"]}}
+        )
+        rows_out = [row for row in cif_wrapper._test_category]
+        self.assertEqual(
+            rows_out,
+            [{"id": "1", "it's \"quoted\"": "A"}, {"id": "2", "it's \"quoted\"": "B"}],
+            "Row iteration failed or gave inconsistent results",
+        )
+
+    def test_iter_str_subclass_keys(self):
+        class Name(str):
+            def __repr__(self):
+                return "undefined_name"
+
+        cif_wrapper = CIFWrapper({"_test_category": {Name("id"): ["1", "2"]}})
+        table = cif_wrapper._test_category
+        self.assertEqual(
+            list(table), [{"id": "1"}, {"id": "2"}], "Row iteration failed"
+        )
+        table["name"] = ["A", "B"]
+        self.assertEqual(
+            list(table),
+            [{"id": "1", "name": "A"}, {"id": "2", "name": "B"}],
+            "Row iteration not updated after adding an item",
+        )
+
+    def test_iter_sizes(self):
+        # many rows use a compiled row factory, over 255 columns cannot
+        keys = ["value_%d" % i for i in range(300)]
+        for n_rows in (1, 100):
+            cif_wrapper = CIFWrapper(
+                {"_test_category": dict((k, [k] * n_rows) for k in keys)}
+            )
+            rows_out = list(cif_wrapper._test_category)
+            self.assertEqual(len(rows_out), n_rows, "Row iteration failed")
+            self.assertEqual(
+                rows_out[-1],
+                dict((k, k) for k in keys),
+                "Row iteration gave inconsistent results",
+            )
+        cif_wrapper = CIFWrapper(
+            {"_test_category": {"id": [str(i) for i in range(100)], "x": ["A"] * 100}}
+        )
+        self.assertEqual(
+            list(cif_wrapper._test_category)[99],
+            {"id": "99", "x": "A"},
+            "Row iteration gave inconsistent results",
+        )
+        self.assertEqual(
+            list(cif_wrapper._test_category.searchiter("id", "99")),
+            [{"id": "99", "x": "A"}],
+            "Row search gave inconsistent results",
+        )
+
+    def test_itertuples(self):
+        cif_wrapper = CIFWrapper(
+            self.raw_dictionary["TEST_BLOCK_1"], preserve_token_order=True
+        )
+        rows_out = list(cif_wrapper._test_category_2.itertuples())
+        self.assertEqual(
+            [row.test_value_2 for row in rows_out],
+            ["Sleepy", "Dopey", "Bashful", "Grumpy"],
+            "Named tuple row iteration failed or gave inconsistent results",
+        )
+        self.assertEqual(
+            rows_out[0]._asdict(),
+            {
+                "test_value_3": "A ->\nLINE = A",
+                "test_value_2": "Sleepy",
+                "test_value_1": 1,
+            },
+            "Named tuple row conversion to dictionary failed",
+        )
+        cif_wrapper = CIFWrapper({"_test_category": {"id": ["1"], "1-bad": ["A"]}})
+        row = next(cif_wrapper._test_category.itertuples())
+        self.assertEqual(row.id, "1", "Named tuple row field access failed")
+        self.assertEqual(
+            row._asdict(),
+            {"id": "1", "1-bad": "A"},
+            "Renamed fields should map back to the original item names",
+        )
+        cif_wrapper = CIFWrapper(
+            {"_test_category": {"as_dict": ["1"], "_keys": ["A"], "x": ["B"]}}
+        )
+        row = next(cif_wrapper._test_category.itertuples())
+        self.assertEqual(row.as_dict, "1", "Field shadowed by a row helper")
+        self.assertEqual(
+            row._asdict(),
+            {"as_dict": "1", "_keys": "A", "x": "B"},
+            "Named tuple row conversion to dictionary failed",
+        )
+
+    def test_itertuples_wide(self):
+        keys = ["value_%d" % i for i in range(300)] + ["1-bad"]
+        cif_wrapper = CIFWrapper(
+            {"_test_category": dict((k, [k, "B"]) for k in keys)}
+        )
+        rows_out = list(cif_wrapper._test_category.itertuples())
+        self.assertEqual(len(rows_out), 2, "Named tuple row iteration failed")
+        self.assertEqual(
+            rows_out[0].value_299, "value_299", "Named tuple row field access failed"
+        )
+        self.assertEqual(
+            rows_out[1]._asdict(),
+            dict((k, "B") for k in keys),
+            "Named tuple row conversion to dictionary failed",
+        )
+        position = cif_wrapper._test_category.contents().index("1-bad")
+        self.assertEqual(
+            rows_out[0]._fields[position],
+            "_%d" % position,
+            "Invalid field not renamed",
+        )
+
     def test_search(self):
         cif_wrapper = CIFWrapper(
             self.raw_dictionary["TEST_BLOCK_1"], preserve_token_order=True
@@ -174,6 +346,23 @@ class CIFWrapperTableTestCase(unittest.TestCase):
         self.assertEqual(
             result[2], check_row, "Category search failed or gave inconsistent results"
         )
+        cif_wrapper._test_category_2["test_value_2"] = [
+            "Sleepy",
+            "Dopey",
+            "Sleepy",
+            "Grumpy",
+        ]
+        result = cif_wrapper._test_category_2.search("test_value_2", "Sleepy")
+        self.assertEqual(
+            sorted(result.keys()),
+            [0, 2],
+            "Category search failed or gave inconsistent results",
+        )
+        self.assertEqual(
+            cif_wrapper._test_category_2.search("test_value_2", "Happy"),
+            {},
+            "Category search for a missing value should find no rows",
+        )
 
     def test_searchIter(self):
         cif_wrapper = CIFWrapper(
@@ -191,6 +380,28 @@ class CIFWrapperTableTestCase(unittest.TestCase):
             result[0], check_row, "Row iteration failed or gave inconsistent results"
         )
 
+    def test_searchRegex(self):
+        cif_wrapper = CIFWrapper(
+            self.raw_dictionary["TEST_BLOCK_1"], preserve_token_order=True
+        )
+        result = cif_wrapper._test_category_2.search(
+            "test_value_2", re.compile(r"[A-Z][a-z]+y$")
+        )
+        self.assertEqual(
+            sorted(result.keys()),
+            [0, 1, 3],
+            "Regular expression search failed or gave inconsistent results",
+        )
+        result = [
+            row["test_value_1"]
+            for row in cif_wrapper._test_category_2.searchiter(
+                "test_value_2", re.compile(r"[A-Z][a-z]+y$")
+            )
+        ]
+        self.assertEqual(
+            result, [1, 2, 4], "Row iteration failed or gave inconsistent results"
+        )
+
     def test_listContents(self):
         cif_wrapper = CIFWrapper(
             self.raw_dictionary["TEST_BLOCK_1"], preserve_token_order=True
@@ -1,4 +1,7 @@
+import pickle
 import unittest
+import weakref
+
 from pdbecif.mmcif import DataBlock, CifFile
 
 
@@ -131,6 +134,45 @@ class CifFileTestCase(unittest.TestCase):
             "CifFile failed to import dictionary",
         )
 
+    def test_dictionaryImportUnicode(self):
+        cf = CifFile(mmcif_data_map={u"blk": {u"_cat": {u"a": u"1"}}})
+        self.assertEqual(
+            cf.getDataBlock(u"blk").getCategory(u"_cat").getItem(u"a").value,
+            u"1",
+            "CifFile failed to import dictionary with unicode names",
+        )
+        category = cf.getDataBlock(u"blk").getCategory(u"_cat")
+        self.assertIs(
+            category.setItem(u"a"),
+            category.getItem(u"a"),
+            "Category.setItem failed with unicode name",
+        )
+
+    def test_pickle(self):
+        cf = CifFile(mmcif_data_map=self.raw_dictionary)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            cf_copy = pickle.loads(pickle.dumps(cf, protocol))
+            category = cf_copy.getDataBlock("TEST_BLOCK_2").getCategory(
+                "_test_category_1"
+            )
+            self.assertEqual(
+                category.getItem("test_value_1").value,
+                [1, 2, 3, 4],
+                "CifFile pickling failed",
+            )
+            self.assertIs(
+                category.parent,
+                cf_copy.getDataBlock("TEST_BLOCK_2"),
+                "CifFile pickling did not keep the parent links",
+            )
+
+    def test_weakref(self):
+        cf = CifFile(mmcif_data_map=self.raw_dictionary)
+        datablock = cf.getDataBlock("TEST_BLOCK_2")
+        category = datablock.getCategory("_test_category_1")
+        for obj in (cf, datablock, category, category.getItem("test_value_1")):
+            self.assertIs(weakref.ref(obj)(), obj, "Weak reference failed")
+
     def test_initializeWithDictionary(self):
         cf = CifFile(mmcif_data_map=self.raw_dictionary)
 
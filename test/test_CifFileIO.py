@@ -255,6 +255,23 @@ class CifFileIOTestCase(unittest.TestCase):
             "mmCIF data  was not written correctly",
         )
 
+    def test_write_raw_dictionary_with_empty_block(self):
+        unit_test_file = "io_testcase_empty.cif"
+        raw_dictionary = {"EMPTY_BLOCK": {}}
+        raw_dictionary.update(self.raw_dictionary)
+        cfw = CifFileWriter(file_path=os.path.join(self.FILE_ROOT, unit_test_file))
+        cfw.write(raw_dictionary)
+        del cfw
+        cfr = CifFileReader(input="data", preserve_order=True)
+        test_file = cfr.read(
+            os.path.join(self.FILE_ROOT, unit_test_file), output="cif_wrapper"
+        )
+        self.assertEqual(
+            test_file["TEST_BLOCK_1"]._test_category_2.test_value_1,
+            ["1", "2", "3", "4"],
+            "mmCIF data  was not written correctly",
+        )
+
     def test_write_mmCIF_dictionary(self):
         unit_test_file = "io_testcase_5.cif"
         cfr = CifFileReader(input="dictionary", preserve_order=True)
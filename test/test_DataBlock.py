@@ -18,6 +18,14 @@ class DataBlockTestCase(unittest.TestCase):
         self.assertEqual(self.db.id, "FOOBAR", "Could not change datablock ID")
         self.db.updateId("TEST")
 
+    def test_updateIdStrSubclass(self):
+        class Name(str):
+            pass
+
+        self.db.updateId(Name("FOOBAR"))
+        self.assertEqual(self.db.id, "FOOBAR", "Could not change datablock ID")
+        self.db.updateId("TEST")
+
     def test_getId(self):
         self.assertEqual(self.db.getId(), "TEST", "Could not get datablock ID")
 
@@ -227,6 +235,25 @@ class DataBlockTestCase(unittest.TestCase):
             msg + " recycleBin should contain the SaveFrame instance",
         )
 
+    def test_removeChildSubclass(self):
+        msg = "DataBlock.removeChild"
+
+        class SubCategory(Category):
+            __slots__ = ()
+
+        cat_foo = SubCategory("_foo", self.db)
+        self.assertTrue(
+            self.db.removeChild(cat_foo), msg + " did not return expected True"
+        )
+        self.assertListEqual(
+            self.db.getCategories(), [], msg + " categories should be an empty list"
+        )
+        self.assertEqual(
+            self.db.recycleBin.get("foo"),
+            cat_foo,
+            msg + " recycleBin should contain the Category instance",
+        )
+
     def test_removeChildBadRef(self):
         msg = "DataBlock.removeChild"
         self.db.setCategory("foo")
@@ -19,6 +19,14 @@ class ItemTestCase(unittest.TestCase):
     def test_getItemName(self):
         self.assertEqual(self.im.getItemName(), "bar", "Could not get Item name")
 
+    def test_strSubclassName(self):
+        class Name(str):
+            pass
+
+        im = Item(Name("baz"), parent=self.ct)
+        self.assertEqual(im.getItemName(), "baz", "Could not get Item name")
+        self.assertIs(self.ct.getItem("baz"), im, "Item not registered")
+
     def test_setValue(self):
         self.im.setValue("val_1")
         self.assertEqual(self.im.value, "val_1", "Item value not set correctly")
@@ -36,6 +44,18 @@ class ItemTestCase(unittest.TestCase):
         )
         self.assertEqual(self.im.isColumn, True, "Item isColumn not set correctly")
 
+    def test_fromColumn(self):
+        im = Item.fromColumn("baz", self.ct, ["val_1", "val_2"])
+        self.assertIs(self.ct.getItem("baz"), im, "Item not added to Category")
+        self.assertEqual(im.value, ["val_1", "val_2"], "Item value not set correctly")
+        self.assertEqual(
+            im.type,
+            ["DEFAULTSTRING", "DEFAULTSTRING"],
+            "Item type not set correctly",
+        )
+        self.assertEqual(im.isColumn, True, "Item isColumn not set correctly")
+        self.assertEqual(self.ct.isTable, True, "Category isTable not set correctly")
+
     def test_getRawValue(self):
         self.im.value = None
         self.im.setValue("_val_3")
@@ -111,8 +131,6 @@ class ItemTestCase(unittest.TestCase):
         im_2 = Item("bogus", parent=self.ct)
         im_2.reset()
         im_2.value = None
-        im_2.parent.isColumn = False
-        im_2.isTable = False
         im_2.setValue(["X"])
         im_2.getFormattedValue()
         im_2.value = '_val_"'
@@ -129,6 +147,29 @@ class ItemTestCase(unittest.TestCase):
         im_2.getFormattedValue()
         im_2.remove()
 
+    def test_getFormattedValue_refresh(self):
+        self.im.setValue("val_1")
+        self.im.setValue("val_2")
+        self.im.getFormattedValue().append("zzz")
+        self.im.getRawValue()[0] = "val 1"
+        self.assertEqual(
+            self.im.getFormattedValue(),
+            ['"val 1"', "val_2"],
+            "T1: Formatted value not refreshed after value was edited in place",
+        )
+        self.im.value = "val_2"
+        self.assertEqual(
+            self.im.getFormattedValue(),
+            "val_2",
+            "T2: Formatted value not refreshed after value was rebound",
+        )
+        self.im.reset()
+        self.assertEqual(
+            self.im.getFormattedValue(),
+            ".",
+            "T3: Formatted value not refreshed after reset",
+        )
+
     def test_remove(self):
         self.im.remove()
         self.assertIsNone(self.ct.items.get("bar"), "did not remove Item as expected")